@@ -4,94 +4,93 @@ These tests cover token retrieval, caching, and error handling.
 """
 
 import pytest
-from unittest.mock import MagicMock
-from mpesakit.http_client import HttpClient
+from types import MappingProxyType
 from mpesakit.auth import TokenManager
 from mpesakit.errors import MpesaApiException, MpesaError
 
-
-@pytest.fixture
-def valid_credentials():
-    """Provide valid M-Pesa credentials for testing."""
-    return {
-        "consumer_key": "test_key",
-        "consumer_secret": "test_secret",
-    }
+_RESP_OK = MappingProxyType(
+    {"access_token": "mocked_token_1234567890", "expires_in": 3600}
+)
+_RESP_CACHED = MappingProxyType(
+    {"access_token": "cached_token_1234567890", "expires_in": 3600}
+)
+
+_ERR_INVALID_CREDS = MpesaApiException(
+    MpesaError(
+        error_code="AUTH_INVALID_CREDENTIALS",
+        error_message="Invalid credentials",
+        status_code=403,
+    )
+)
+_ERR_INVALID_GRANT_TYPE = MpesaApiException(
+    MpesaError(
+        error_code="AUTH_INVALID_GRANT_TYPE",
+        error_message="Invalid grant_type",
+        status_code=403,
+    )
+)
+_ERR_INVALID_AUTH_TYPE = MpesaApiException(
+    MpesaError(
+        error_code="AUTH_INVALID_AUTH_TYPE",
+        error_message="Invalid auth type",
+        status_code=403,
+    )
+)
+_ERR_EMPTY_MESSAGE = MpesaApiException(
+    MpesaError(
+        error_code="SOME_CODE",
+        error_message="",
+        status_code=400,
+    )
+)
 
 
-@pytest.fixture
-def invalid_credentials():
-    """Provide invalid M-Pesa credentials for testing."""
-    return {
-        "consumer_key": "invalid_key",
-        "consumer_secret": "invalid_secret",
-    }
+@pytest.fixture(scope="module")
+def token_manager(valid_credentials, _http_client_stub):
+    """Provide a TokenManager shared by the tests in this module."""
+    return TokenManager(
+        consumer_key=valid_credentials["consumer_key"],
+        consumer_secret=valid_credentials["consumer_secret"],
+        http_client=_http_client_stub,
+    )
 
 
-@pytest.fixture
-def mock_http_client():
-    """Provide a MagicMock HttpClient for testing."""
-    client = MagicMock(spec=HttpClient)
-    return client
+@pytest.fixture(autouse=True)
+def _reset_token_manager(token_manager):
+    """Drop any cached access token before each test."""
+    token_manager._access_token = None
 
 
-def test_get_token_success(valid_credentials, mock_http_client):
+def test_get_token_success(token_manager, mock_http_client):
     """Test that a valid token can be retrieved."""
-    mock_http_client.get.return_value = {
-        "access_token": "mocked_token_1234567890",
-        "expires_in": 3600,
-    }
-    tm = TokenManager(
-        consumer_key=valid_credentials["consumer_key"],
-        consumer_secret=valid_credentials["consumer_secret"],
-        http_client=mock_http_client,
-    )
-    token = tm.get_token()
+    mock_http_client.get_mock.return_value = _RESP_OK
+    token = token_manager.get_token()
     assert token == "mocked_token_1234567890"
 
 
-def test_token_caching(valid_credentials, mock_http_client):
+def test_token_caching(token_manager, mock_http_client):
     """Test that the token is cached and reused until it expires."""
-    mock_http_client.get.return_value = {
-        "access_token": "cached_token_1234567890",
-        "expires_in": 3600,
-    }
-    tm = TokenManager(
-        consumer_key=valid_credentials["consumer_key"],
-        consumer_secret=valid_credentials["consumer_secret"],
-        http_client=mock_http_client,
-    )
-    token1 = tm.get_token()
-    token2 = tm.get_token()
+    mock_http_client.get_mock.return_value = _RESP_CACHED
+    token1 = token_manager.get_token()
+    token2 = token_manager.get_token()
     assert token1 == token2
 
 
-def test_force_refresh_token(valid_credentials, mock_http_client):
+def test_force_refresh_token(token_manager, mock_http_client):
     """Test that forcing a token refresh retrieves a new token."""
-    mock_http_client.get.side_effect = [
+    mock_http_client.get_mock.side_effect = [
         {"access_token": "token1", "expires_in": 3600},
         {"access_token": "token2", "expires_in": 3600},
     ]
-    tm = TokenManager(
-        consumer_key=valid_credentials["consumer_key"],
-        consumer_secret=valid_credentials["consumer_secret"],
-        http_client=mock_http_client,
-    )
-    token1 = tm.get_token()
-    token2 = tm.get_token(force_refresh=True)
+    token1 = token_manager.get_token()
+    token2 = token_manager.get_token(force_refresh=True)
     assert token1 == "token1"
     assert token2 == "token2"
 
 
 def test_invalid_credentials_raises(mock_http_client, invalid_credentials):
     """Test that invalid credentials raise an exception."""
-    mock_http_client.get.side_effect = MpesaApiException(
-        MpesaError(
-            error_code="AUTH_INVALID_CREDENTIALS",
-            error_message="Invalid credentials",
-            status_code=403,
-        )
-    )
+    mock_http_client.get_mock.side_effect = _ERR_INVALID_CREDS
     tm = TokenManager(
         consumer_key=invalid_credentials["consumer_key"],
         consumer_secret=invalid_credentials["consumer_secret"],
@@ -99,95 +98,55 @@ def test_invalid_credentials_raises(mock_http_client, invalid_credentials):
     )
     with pytest.raises(MpesaApiException) as excinfo:
         tm.get_token()
-    assert (
-        "Invalid credentials" in str(excinfo.value)
-        or excinfo.value.error.status_code == 403
-    )
+    assert excinfo.value.error.error_message == "Invalid credentials"
+    assert excinfo.value.error.status_code == 403
 
 
-def test_invalid_grant_type(valid_credentials, mock_http_client, monkeypatch):
+def test_invalid_grant_type(token_manager, mock_http_client, monkeypatch):
     """Test that an invalid grant type raises an exception."""
-    tm = TokenManager(
-        consumer_key=valid_credentials["consumer_key"],
-        consumer_secret=valid_credentials["consumer_secret"],
-        http_client=mock_http_client,
-    )
-    mock_http_client.get.side_effect = MpesaApiException(
-        MpesaError(
-            error_code="AUTH_INVALID_GRANT_TYPE",
-            error_message="Invalid grant_type",
-            status_code=403,
-        )
-    )
+    mock_http_client.get_mock.side_effect = _ERR_INVALID_GRANT_TYPE
     with pytest.raises(MpesaApiException) as excinfo:
-        tm.get_token(force_refresh=True)
+        token_manager.get_token(force_refresh=True)
     assert excinfo.value.error.status_code == 403
 
 
-def test_invalid_auth_type(valid_credentials, mock_http_client, monkeypatch):
+def test_invalid_auth_type(token_manager, mock_http_client, monkeypatch):
     """Test that an invalid auth type raises an exception."""
-    tm = TokenManager(
-        consumer_key=valid_credentials["consumer_key"],
-        consumer_secret=valid_credentials["consumer_secret"],
-        http_client=mock_http_client,
-    )
-    monkeypatch.setattr(tm, "_get_basic_auth_header", lambda: "Bearer something")
-    mock_http_client.get.side_effect = MpesaApiException(
-        MpesaError(
-            error_code="AUTH_INVALID_AUTH_TYPE",
-            error_message="Invalid auth type",
-            status_code=403,
-        )
+    monkeypatch.setattr(
+        token_manager, "_get_basic_auth_header", lambda: "Bearer something"
     )
+    mock_http_client.get_mock.side_effect = _ERR_INVALID_AUTH_TYPE
     with pytest.raises(MpesaApiException) as excinfo:
-        tm.get_token(force_refresh=True)
+        token_manager.get_token(force_refresh=True)
     assert excinfo.value.error.status_code == 403
 
 
 def test_mpesa_api_exception_with_empty_error_message(
-    valid_credentials, mock_http_client, monkeypatch
+    token_manager, mock_http_client, monkeypatch
 ):
     """Test that an empty error message raises a specific exception."""
-    tm = TokenManager(
-        consumer_key=valid_credentials["consumer_key"],
-        consumer_secret=valid_credentials["consumer_secret"],
-        http_client=mock_http_client,
-    )
 
     def fake_get(*args, **kwargs):
-        raise MpesaApiException(
-            MpesaError(
-                error_code="SOME_CODE",
-                error_message="",
-                status_code=400,
-            )
-        )
+        raise _ERR_EMPTY_MESSAGE
 
     monkeypatch.setattr(mock_http_client, "get", fake_get)
     with pytest.raises(MpesaApiException) as excinfo:
-        tm.get_token(force_refresh=True)
+        token_manager.get_token(force_refresh=True)
     err = excinfo.value.error
     assert err.error_code == "AUTH_INVALID_CREDENTIALS"
     assert "Invalid credentials" in err.error_message
     assert err.status_code == 400
 
 
-def test_token_missing_raises_exception(
-    valid_credentials, mock_http_client, monkeypatch
-):
+def test_token_missing_raises_exception(token_manager, mock_http_client, monkeypatch):
     """Test that a missing token raises an exception."""
-    tm = TokenManager(
-        consumer_key=valid_credentials["consumer_key"],
-        consumer_secret=valid_credentials["consumer_secret"],
-        http_client=mock_http_client,
-    )
 
     def fake_get(*args, **kwargs):
         return {"expires_in": 3600}
 
     monkeypatch.setattr(mock_http_client, "get", fake_get)
     with pytest.raises(MpesaApiException) as excinfo:
-        tm.get_token(force_refresh=True)
+        token_manager.get_token(force_refresh=True)
     err = excinfo.value.error
     assert err.error_code == "TOKEN_MISSING"
     assert "No access token returned" in err.error_message
@@ -5,9 +5,7 @@ process responses correctly, and manage error cases.
 """
 
 import pytest
-from unittest.mock import MagicMock
-from mpesakit.auth import TokenManager
-from mpesakit.http_client import HttpClient
+from types import MappingProxyType
 
 from mpesakit.business_buy_goods import (
     BusinessBuyGoods,
@@ -19,19 +17,68 @@ from mpesakit.business_buy_goods import (
     BusinessBuyGoodsTimeoutCallbackResponse,
 )
 
+# Built once at import; the SDK only reads the request, so tests can share it.
+# The payload is known-valid, so skip validation with model_construct.
+_VALID_REQ = BusinessBuyGoodsRequest.model_construct(
+    Initiator="API_Username",
+    SecurityCredential="encrypted_credential",
+    Amount=239,
+    PartyA=123456,
+    PartyB=654321,
+    AccountReference="353353",
+    Remarks="OK",
+    QueueTimeOutURL="https://mydomain.com/b2b/buygoods/queue/",
+    ResultURL="https://mydomain.com/b2b/buygoods/result/",
+)
 
-@pytest.fixture
-def mock_token_manager():
-    """Mock TokenManager to return a fixed token."""
-    mock = MagicMock(spec=TokenManager)
-    mock.get_token.return_value = "test_token"
-    return mock
+_RESP_OK = MappingProxyType(
+    {
+        "OriginatorConversationID": "5118-111210482-1",
+        "ConversationID": "AG_20230420_2010759fd5662ef6d054",
+        "ResponseCode": "0",
+        "ResponseDescription": "Accept the service request successfully.",
+    }
+)
 
 
-@pytest.fixture
-def mock_http_client():
-    """Mock HttpClient to simulate HTTP requests."""
-    return MagicMock(spec=HttpClient)
+@pytest.fixture(scope="module")
+def parsed_result_cb():
+    """Parse the successful result callback payload once per module."""
+    return BusinessBuyGoodsResultCallback(
+        Result={
+            "ResultType": 0,
+            "ResultCode": 0,
+            "ResultDesc": "The service request is processed successfully",
+            "OriginatorConversationID": "626f6ddf-ab37-4650-b882-b1de92ec9aa4",
+            "ConversationID": "AG_20181005_00004d7ee675c0c7ee0b",
+            "TransactionID": "QKA81LK5CY",
+            "ResultParameters": {
+                "ResultParameter": [
+                    {"Key": "Amount", "Value": "190.00"},
+                    {"Key": "Currency", "Value": "KES"},
+                ]
+            },
+            "ReferenceData": {
+                "ReferenceItem": [
+                    {"Key": "BillReferenceNumber", "Value": "19008"},
+                ]
+            },
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def parsed_timeout_cb():
+    """Parse the timeout callback payload once per module."""
+    return BusinessBuyGoodsTimeoutCallback(
+        Result={
+            "ResultType": 1,
+            "ResultCode": 1,
+            "ResultDesc": "The service request timed out.",
+            "OriginatorConversationID": "8521-4298025-1",
+            "ConversationID": "AG_20181005_00004d7ee675c0c7ee0b",
+        }
+    )
 
 
 @pytest.fixture
@@ -42,77 +89,31 @@ def business_buy_goods(mock_http_client, mock_token_manager):
     )
 
 
-def valid_business_buy_goods_request():
-    """Create a valid BusinessBuyGoodsRequest for testing."""
-    return BusinessBuyGoodsRequest(
-        Initiator="API_Username",
-        SecurityCredential="encrypted_credential",
-        Amount=239,
-        PartyA=123456,
-        PartyB=654321,
-        AccountReference="353353",
-        Remarks="OK",
-        QueueTimeOutURL="https://mydomain.com/b2b/buygoods/queue/",
-        ResultURL="https://mydomain.com/b2b/buygoods/result/",
-    )
-
-
 def test_buy_goods_request_acknowledged(business_buy_goods, mock_http_client):
     """Test that buy goods request is acknowledged, not finalized."""
-    request = valid_business_buy_goods_request()
-    response_data = {
-        "OriginatorConversationID": "5118-111210482-1",
-        "ConversationID": "AG_20230420_2010759fd5662ef6d054",
-        "ResponseCode": "0",
-        "ResponseDescription": "Accept the service request successfully.",
-    }
-    mock_http_client.post.return_value = response_data
+    mock_http_client.response = _RESP_OK
 
-    response = business_buy_goods.buy_goods(request)
+    response = business_buy_goods.buy_goods(_VALID_REQ)
 
     assert isinstance(response, BusinessBuyGoodsResponse)
     assert response.is_successful() is True
-    assert response.ConversationID == response_data["ConversationID"]
-    assert (
-        response.OriginatorConversationID == response_data["OriginatorConversationID"]
-    )
-    assert response.ResponseCode == response_data["ResponseCode"]
-    assert response.ResponseDescription == response_data["ResponseDescription"]
+    assert response.ConversationID == _RESP_OK["ConversationID"]
+    assert response.OriginatorConversationID == _RESP_OK["OriginatorConversationID"]
+    assert response.ResponseCode == _RESP_OK["ResponseCode"]
+    assert response.ResponseDescription == _RESP_OK["ResponseDescription"]
 
 
 def test_buy_goods_http_error(business_buy_goods, mock_http_client):
     """Test handling of HTTP errors during buy goods request."""
-    request = valid_business_buy_goods_request()
-    mock_http_client.post.side_effect = Exception("HTTP error")
+    mock_http_client.error = Exception("HTTP error")
     with pytest.raises(Exception) as excinfo:
-        business_buy_goods.buy_goods(request)
-    assert "HTTP error" in str(excinfo.value)
+        business_buy_goods.buy_goods(_VALID_REQ)
+    assert excinfo.value.args[0] == "HTTP error"
 
 
-def test_business_buy_goods_result_callback_success():
+def test_business_buy_goods_result_callback_success(parsed_result_cb):
     """Test parsing of a successful business buy goods result callback."""
-    payload = {
-        "Result": {
-            "ResultType": 0,
-            "ResultCode": 0,
-            "ResultDesc": "The service request is processed successfully",
-            "OriginatorConversationID": "626f6ddf-ab37-4650-b882-b1de92ec9aa4",
-            "ConversationID": "AG_20181005_00004d7ee675c0c7ee0b",
-            "TransactionID": "QKA81LK5CY",
-            "ResultParameters": {
-                "ResultParameter": [
-                    {"Key": "Amount", "Value": "190.00"},
-                    {"Key": "Currency", "Value": "KES"},
-                ]
-            },
-            "ReferenceData": {
-                "ReferenceItem": [
-                    {"Key": "BillReferenceNumber", "Value": "19008"},
-                ]
-            },
-        }
-    }
-    callback = BusinessBuyGoodsResultCallback(**payload)
+    callback = parsed_result_cb
     assert callback.is_successful() is True
     assert callback.Result.TransactionID == "QKA81LK5CY"
     assert callback.Result.ResultParameters.ResultParameter[0].Key == "Amount"
@@ -125,18 +126,9 @@ def test_business_buy_goods_result_callback_response():
     assert "Callback received successfully" in resp.ResultDesc
 
 
-def test_business_buy_goods_timeout_callback():
+def test_business_buy_goods_timeout_callback(parsed_timeout_cb):
     """Test parsing of a business buy goods timeout callback."""
-    payload = {
-        "Result": {
-            "ResultType": 1,
-            "ResultCode": 1,
-            "ResultDesc": "The service request timed out.",
-            "OriginatorConversationID": "8521-4298025-1",
-            "ConversationID": "AG_20181005_00004d7ee675c0c7ee0b",
-        }
-    }
-    callback = BusinessBuyGoodsTimeoutCallback(**payload)
+    callback = parsed_timeout_cb
     assert callback.Result.ResultType == 1
     assert callback.Result.ResultCode == 1
     assert "timed out" in callback.Result.ResultDesc
@@ -0,0 +1,100 @@
+"""Shared fixtures for the unit test suite.
+
+The stubs are built once per session; the public ``mock_*`` fixtures are
+function-scoped and reset the shared stub before handing it to a test.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from mpesakit.auth import TokenManager
+from mpesakit.http_client import HttpClient
+
+
+class StubHttpClient(HttpClient):
+    """Lightweight HttpClient with a mock-backed ``get`` and a recording ``post``.
+
+    ``get`` delegates to ``get_mock``. ``post`` stores its arguments in
+    ``last`` and returns ``response``, or raises ``error`` when one is set.
+    """
+
+    def __init__(self):
+        """Initialize the stub with a fresh ``get_mock`` and no recorded posts."""
+        self.get_mock = MagicMock()
+        self.response = None
+        self.error = None
+        self.last = None
+        self.calls = 0
+
+    def get(self, url, params=None, headers=None):
+        """Forward the call to ``get_mock``."""
+        return self.get_mock(url, params=params, headers=headers)
+
+    def post(self, url, json, headers):
+        """Record the call and return the canned response."""
+        self.calls += 1
+        self.last = ((url,), {"json": json, "headers": headers})
+        if self.error is not None:
+            raise self.error
+        return self.response
+
+    def reset(self):
+        """Clear recorded calls, canned responses and errors."""
+        self.get_mock.reset_mock(return_value=True, side_effect=True)
+        self.response = None
+        self.error = None
+        self.last = None
+        self.calls = 0
+
+
+class StubTokenManager(TokenManager):
+    """TokenManager that always returns a fixed token without any HTTP call.
+
+    Build it with ``model_construct()``; the credential fields are never read.
+    """
+
+    def get_token(self, force_refresh: bool = False) -> str:
+        """Return the fixed test token."""
+        return "test_token"
+
+
+@pytest.fixture(scope="session")
+def valid_credentials():
+    """Provide valid M-Pesa credentials for testing."""
+    return {
+        "consumer_key": "test_key",
+        "consumer_secret": "test_secret",
+    }
+
+
+@pytest.fixture(scope="session")
+def invalid_credentials():
+    """Provide invalid M-Pesa credentials for testing."""
+    return {
+        "consumer_key": "invalid_key",
+        "consumer_secret": "invalid_secret",
+    }
+
+
+@pytest.fixture(scope="session")
+def _http_client_stub():
+    """Build the HttpClient stub shared by the whole session."""
+    return StubHttpClient()
+
+
+@pytest.fixture(scope="session")
+def _token_manager_stub():
+    """Build the TokenManager stub shared by the whole session."""
+    return StubTokenManager.model_construct()
+
+
+@pytest.fixture
+def mock_http_client(_http_client_stub):
+    """Stub HttpClient to simulate HTTP requests, reset for each test."""
+    _http_client_stub.reset()
+    return _http_client_stub
+
+
+@pytest.fixture
+def mock_token_manager(_token_manager_stub):
+    """Stub TokenManager to return a fixed token."""
+    return _token_manager_stub
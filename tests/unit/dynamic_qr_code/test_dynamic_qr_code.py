@@ -1,28 +1,43 @@
 """Unit tests for the Dynamic QR Code functionality of the Mpesa SDK."""
 
 import pytest
-from unittest.mock import MagicMock
+from types import MappingProxyType
 from mpesakit.dynamic_qr_code import (
     DynamicQRGenerateRequest,
     DynamicQRCode,
     DynamicQRTransactionType,
 )
-from mpesakit.auth import TokenManager
-from mpesakit.http_client.mpesa_http_client import MpesaHttpClient
 
+# Known-valid payload fed to the service; validation is covered separately.
+_BUY_GOODS_REQ = DynamicQRGenerateRequest.model_construct(
+    MerchantName="Test Supermarket",
+    RefNo="xewr34fer4t",
+    Amount=200,
+    TrxCode=DynamicQRTransactionType.BUY_GOODS.value,
+    CPI="373132",
+    Size="300",
+)
 
-@pytest.fixture
-def mock_token_manager():
-    """Mock TokenManager to return a fixed token for testing."""
-    mock = MagicMock(spec=TokenManager)
-    mock.get_token.return_value = "test_token"
-    return mock
+# Shared SEND_MONEY fields; each test supplies its own CPI.
+_SEND_MONEY_BASE = MappingProxyType(
+    {
+        "MerchantName": "Test",
+        "RefNo": "ref",
+        "Amount": 100,
+        "TrxCode": DynamicQRTransactionType.SEND_MONEY,
+        "Size": "300",
+    }
+)
 
+_VALID_CPIS = frozenset({"0712345678", "+254712345678", "254712345678"})
 
-@pytest.fixture
-def mock_http_client():
-    """Mock MpesaHttpClient for testing."""
-    return MagicMock(spec=MpesaHttpClient)
+_RESP_OK = MappingProxyType(
+    {
+        "ResponseCode": "00",
+        "ResponseDescription": "Success",
+        "QRCode": "base64-encoded-string",
+    }
+)
 
 
 @pytest.fixture
@@ -33,22 +48,9 @@ def dynamic_qr_service(mock_http_client, mock_token_manager):
 
 def test_generate_dynamic_qr_success(dynamic_qr_service, mock_http_client):
     """Test successful Dynamic QR Code generation."""
-    request = DynamicQRGenerateRequest(
-        MerchantName="Test Supermarket",
-        RefNo="xewr34fer4t",
-        Amount=200,
-        TrxCode=DynamicQRTransactionType.BUY_GOODS,
-        CPI="373132",
-        Size="300",
-    )
-    response_data = {
-        "ResponseCode": "00",
-        "ResponseDescription": "Success",
-        "QRCode": "base64-encoded-string",
-    }
-    mock_http_client.post.return_value = response_data
+    mock_http_client.response = _RESP_OK
 
-    response = dynamic_qr_service.generate(request)
+    response = dynamic_qr_service.generate(_BUY_GOODS_REQ)
 
     assert response.is_successful() is True
 
@@ -58,27 +60,19 @@ def test_generate_dynamic_qr_success(dynamic_qr_service, mock_http_client):
         getattr(response, "QRCode", None) == "base64-encoded-string"
         or getattr(response, "qr_code", None) == "base64-encoded-string"
     )
-    mock_http_client.post.assert_called_once()
-    args, kwargs = mock_http_client.post.call_args
-    assert "Authorization" in kwargs["headers"]
-    assert kwargs["headers"]["Authorization"] == "Bearer test_token"
+    assert mock_http_client.calls == 1
+    headers = mock_http_client.last[1]["headers"]
+    assert "Authorization" in headers
+    assert headers["Authorization"] == "Bearer test_token"
 
 
 def test_generate_dynamic_qr_handles_http_error(dynamic_qr_service, mock_http_client):
     """Test that an HTTP error during Dynamic QR Code generation is handled."""
-    request = DynamicQRGenerateRequest(
-        MerchantName="Test Supermarket",
-        RefNo="xewr34fer4t",
-        Amount=200,
-        TrxCode=DynamicQRTransactionType.BUY_GOODS,
-        CPI="373132",
-        Size="300",
-    )
-    mock_http_client.post.side_effect = Exception("HTTP error")
+    mock_http_client.error = Exception("HTTP error")
 
     with pytest.raises(Exception) as excinfo:
-        dynamic_qr_service.generate(request)
-    assert "HTTP error" in str(excinfo.value)
+        dynamic_qr_service.generate(_BUY_GOODS_REQ)
+    assert excinfo.value.args[0] == "HTTP error"
 
 
 def test_generate_dynamic_qr_invalid_trx_code():
@@ -97,59 +91,35 @@ def test_generate_dynamic_qr_invalid_trx_code():
     assert "TrxCode must be one of:" in str(excinfo.value)
 
 
-def test_generate_dynamic_qr_send_money_cpi_normalization(monkeypatch):
-    """Test CPI normalization for SEND_MONEY TrxCode."""
-    # Patch normalize_phone_number to simulate normalization
+@pytest.fixture
+def patched_phone_norm(monkeypatch):
+    """Patch normalize_phone_number to simulate normalization."""
     monkeypatch.setattr(
         "mpesakit.dynamic_qr_code.schemas.normalize_phone_number",
-        lambda cpi: "254712345678"
-        if cpi in ["0712345678", "+254712345678", "254712345678"]
-        else None,
+        lambda cpi: "254712345678" if cpi in _VALID_CPIS else None,
     )
 
-    # Should normalize '0712345678' to '254712345678'
-    req = DynamicQRGenerateRequest(
-        MerchantName="Test",
-        RefNo="ref",
-        Amount=100,
-        TrxCode=DynamicQRTransactionType.SEND_MONEY,
-        CPI="0712345678",
-        Size="300",
-    )
-    assert req.CPI == "254712345678"
-
-    # Should normalize '+254712345678' to '254712345678'
-    req = DynamicQRGenerateRequest(
-        MerchantName="Test",
-        RefNo="ref",
-        Amount=100,
-        TrxCode=DynamicQRTransactionType.SEND_MONEY,
-        CPI="+254712345678",
-        Size="300",
-    )
-    assert req.CPI == "254712345678"
-
-    # Should keep '254712345678' as is
-    req = DynamicQRGenerateRequest(
-        MerchantName="Test",
-        RefNo="ref",
-        Amount=100,
-        TrxCode=DynamicQRTransactionType.SEND_MONEY,
-        CPI="254712345678",
-        Size="300",
-    )
-    assert req.CPI == "254712345678"
 
-    # Should raise ValueError for invalid CPI
+@pytest.mark.parametrize(
+    "cpi_in,cpi_out",
+    [
+        ("0712345678", "254712345678"),
+        ("+254712345678", "254712345678"),
+        ("254712345678", "254712345678"),
+    ],
+)
+def test_generate_dynamic_qr_send_money_cpi_normalization(
+    patched_phone_norm, cpi_in, cpi_out
+):
+    """Test CPI normalization for SEND_MONEY TrxCode."""
+    req = DynamicQRGenerateRequest(**_SEND_MONEY_BASE, CPI=cpi_in)
+    assert req.CPI == cpi_out
+
+
+def test_invalid_cpi_raises(patched_phone_norm):
+    """Test that an invalid CPI for SEND_MONEY TrxCode raises a ValueError."""
     with pytest.raises(ValueError) as excinfo:
-        DynamicQRGenerateRequest(
-            MerchantName="Test",
-            RefNo="ref",
-            Amount=100,
-            TrxCode=DynamicQRTransactionType.SEND_MONEY,
-            CPI="12345",
-            Size="300",
-        )
+        DynamicQRGenerateRequest(**_SEND_MONEY_BASE, CPI="12345")
     assert "CPI for SEND_MONEY must be a valid Kenyan phone number" in str(
         excinfo.value
     )